@@ -1,6 +1,10 @@
-import json
+import bisect
+import math
 from typing import Any, Dict
-import requests
+
+import numpy as np
+import orjson
+from numba import njit, prange
 
 
 def lambda_handler(event, context):
@@ -29,39 +33,35 @@ def lambda_handler(event, context):
             tool_name = extended_name.split("___", 1)[1]
 
         if not tool_name:
-            return _response(400, {"error": "Missing tool name"})
-
-        # Canadian Mortgage Pre-Qualification Tools
-        elif tool_name == "calculate_gds_tds":
-            result = calculate_gds_tds(event)
-            return _response(200, {"result": result})
-
-        elif tool_name == "osfi_b20_stress_test":
-            result = osfi_b20_stress_test(event)
-            return _response(200, {"result": result})
-
-        elif tool_name == "calculate_down_payment":
-            result = calculate_down_payment(event)
-            return _response(200, {"result": result})
+            return dict(_ERR_MISSING_TOOL)
 
-        elif tool_name == "check_credit_threshold":
-            result = check_credit_threshold(event)
-            return _response(200, {"result": result})
-
-        elif tool_name == "placeholder_tool":
-            result = placeholder_tool(event)
-            return _response(200, {"result": result})
-
-        else:
+        fn = _TOOLS.get(tool_name)
+        if fn is None:
             return _response(400, {"error": f"Unknown tool '{tool_name}'"})
 
+        result = fn(event)
+
+    # Tools raise on bad arguments; map those to 400 and anything else to 500
+    except (ValueError, TypeError, KeyError, ZeroDivisionError) as e:
+        return _response(400, {"error": str(e)})
     except Exception as e:
         return _response(500, {"system_error": str(e)})
 
+    # Serialize outside the argument-error mapping: an unencodable result is
+    # a server error, not a bad request
+    try:
+        return _response(200, {"result": result})
+    except orjson.JSONEncodeError as e:
+        return _response(500, {"system_error": f"Response serialization failed: {e}"})
+
 
 def _response(status_code: int, body: Dict[str, Any]):
     """Consistent JSON response wrapper."""
-    return {"statusCode": status_code, "body": json.dumps(body)}
+    return {"statusCode": status_code, "body": orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY).decode()}
+
+
+# Constant error response, serialized once at import
+_ERR_MISSING_TOOL = _response(400, {"error": "Missing tool name"})
 
 
 def placeholder_tool(event: Dict[str, Any]):
@@ -83,6 +83,34 @@ def placeholder_tool(event: Dict[str, Any]):
 # Canadian Mortgage Pre-Qualification Tools
 ################################################################################
 
+def _parse_floats(event: Dict[str, Any], fields):
+    """Read (key, default) fields from the event as a tuple of floats."""
+    return tuple(float(event.get(key, default)) for key, default in fields)
+
+
+# Numeric tool arguments as (key, default) pairs, in unpacking order
+_GDS_TDS_FIELDS = (
+    ("gross_annual_income", 0.0),
+    ("monthly_mortgage_payment", 0.0),
+    ("monthly_property_taxes", 0.0),
+    ("monthly_heating", 0.0),
+    ("monthly_condo_fees", 0.0),
+    ("monthly_other_debts", 0.0),
+)
+_STRESS_TEST_FIELDS = (
+    ("purchase_price", 0.0),
+    ("down_payment", 0.0),
+    ("contract_interest_rate", 3.5),
+)
+_DOWN_PAYMENT_FIELDS = (
+    ("purchase_price", 0.0),
+    ("proposed_down_payment", 0.0),
+)
+_CREDIT_FIELDS = (
+    ("down_payment_percentage", 5.0),
+)
+
+
 def calculate_gds_tds(event: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate GDS and TDS ratios for Canadian mortgage underwriting.
@@ -92,47 +120,66 @@ def calculate_gds_tds(event: Dict[str, Any]) -> Dict[str, Any]:
 
     CMHC limits: GDS ≤ 39%, TDS ≤ 44%
     """
-    try:
-        gross_income = float(event.get("gross_annual_income", 0))
-        mortgage_payment = float(event.get("monthly_mortgage_payment", 0))
-        property_taxes = float(event.get("monthly_property_taxes", 0))
-        heating = float(event.get("monthly_heating", 0))
-        condo_fees = float(event.get("monthly_condo_fees", 0))
-        other_debts = float(event.get("monthly_other_debts", 0))
-
-        if gross_income == 0:
-            return {"error": "Gross annual income is required"}
-
-        # Convert annual income to monthly
-        monthly_income = gross_income / 12
-
-        # Calculate GDS
-        gds_costs = mortgage_payment + property_taxes + heating + (0.5 * condo_fees)
-        gds_ratio = (gds_costs / monthly_income) * 100
-
-        # Calculate TDS
-        tds_costs = gds_costs + other_debts
-        tds_ratio = (tds_costs / monthly_income) * 100
-
-        # Check CMHC limits
-        gds_pass = gds_ratio <= 39
-        tds_pass = tds_ratio <= 44
-
-        return {
-            "gds_ratio": round(gds_ratio, 2),
-            "tds_ratio": round(tds_ratio, 2),
-            "gds_limit": 39,
-            "tds_limit": 44,
-            "gds_pass": gds_pass,
-            "tds_pass": tds_pass,
-            "overall_pass": gds_pass and tds_pass,
-            "monthly_income": round(monthly_income, 2),
-            "gds_costs": round(gds_costs, 2),
-            "tds_costs": round(tds_costs, 2),
-            "recommendation": "Approved - Debt ratios within CMHC limits" if (gds_pass and tds_pass) else "Denied - Debt ratios exceed CMHC limits"
-        }
-    except Exception as e:
-        return {"error": f"GDS/TDS calculation failed: {str(e)}"}
+    gross_income, mortgage_payment, property_taxes, heating, condo_fees, other_debts = _parse_floats(
+        event, _GDS_TDS_FIELDS
+    )
+
+    if gross_income == 0:
+        raise ValueError("Gross annual income is required")
+
+    # Convert annual income to monthly
+    monthly_income = gross_income / 12
+
+    # Calculate GDS
+    gds_costs = mortgage_payment + property_taxes + heating + (0.5 * condo_fees)
+    gds_ratio = (gds_costs / monthly_income) * 100
+
+    # Calculate TDS
+    tds_costs = gds_costs + other_debts
+    tds_ratio = (tds_costs / monthly_income) * 100
+
+    # Check CMHC limits
+    gds_pass = gds_ratio <= 39
+    tds_pass = tds_ratio <= 44
+
+    return {
+        "gds_ratio": gds_ratio,
+        "tds_ratio": tds_ratio,
+        "gds_limit": 39,
+        "tds_limit": 44,
+        "gds_pass": gds_pass,
+        "tds_pass": tds_pass,
+        "overall_pass": gds_pass and tds_pass,
+        "monthly_income": monthly_income,
+        "gds_costs": gds_costs,
+        "tds_costs": tds_costs,
+        "recommendation": "Approved - Debt ratios within CMHC limits" if (gds_pass and tds_pass) else "Denied - Debt ratios exceed CMHC limits"
+    }
+
+
+def _amort_payment(loan, r, n):
+    """
+    Monthly payment for a fully amortizing loan.
+
+    Mortgage payment formula: P = L[c(1 + c)^n]/[(1 + c)^n - 1]
+    evaluated as L*c*(1 + 1/expm1(n*log1p(c))) to stay accurate for small c.
+    """
+    if r > 0:
+        denom = math.expm1(n * math.log1p(r))
+        return loan * r * (1.0 + 1.0 / denom)
+    else:
+        return loan / n
+
+
+# Compiled copy for _batch_qualify_kernel; scalar callers use the Python version
+_amort_payment_jit = njit(_amort_payment)
+
+
+def _amort_payment_array(loan, r, n):
+    """Array counterpart of _amort_payment, broadcast over scenarios."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = np.expm1(n * np.log1p(r))
+        return np.where(r > 0, loan * r * (1.0 + 1.0 / denom), loan / n)
 
 
 def osfi_b20_stress_test(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -141,58 +188,107 @@ def osfi_b20_stress_test(event: Dict[str, Any]) -> Dict[str, Any]:
     Borrower must qualify at the higher of:
     - Contract rate + 2%
     - 5.25% (minimum qualifying rate)
+
+    Passing a list for contract_interest_rate evaluates a batch of scenarios
+    (see _osfi_b20_stress_test_batch).
     """
-    try:
-        purchase_price = float(event.get("purchase_price", 0))
-        down_payment = float(event.get("down_payment", 0))
-        contract_rate = float(event.get("contract_interest_rate", 3.5))
-        amortization = int(event.get("amortization_years", 25))
-
-        if purchase_price == 0:
-            return {"error": "Purchase price is required"}
-
-        # Calculate loan amount
-        loan_amount = purchase_price - down_payment
-
-        # Determine qualifying rate
-        stress_rate_1 = contract_rate + 2.0
-        stress_rate_2 = 5.25
-        qualifying_rate = max(stress_rate_1, stress_rate_2)
-
-        # Calculate monthly payment at qualifying rate
-        monthly_rate = qualifying_rate / 100 / 12
-        num_payments = amortization * 12
-
-        # Mortgage payment formula: P = L[c(1 + c)^n]/[(1 + c)^n - 1]
-        if monthly_rate > 0:
-            qualifying_payment = loan_amount * (
-                monthly_rate * (1 + monthly_rate) ** num_payments
-            ) / ((1 + monthly_rate) ** num_payments - 1)
-        else:
-            qualifying_payment = loan_amount / num_payments
-
-        # Calculate actual payment at contract rate
-        contract_monthly_rate = contract_rate / 100 / 12
-        if contract_monthly_rate > 0:
-            actual_payment = loan_amount * (
-                contract_monthly_rate * (1 + contract_monthly_rate) ** num_payments
-            ) / ((1 + contract_monthly_rate) ** num_payments - 1)
-        else:
-            actual_payment = loan_amount / num_payments
-
-        return {
-            "contract_rate": contract_rate,
-            "qualifying_rate": qualifying_rate,
-            "stress_test_applied": qualifying_rate > contract_rate,
-            "qualifying_payment": round(qualifying_payment, 2),
-            "actual_payment": round(actual_payment, 2),
-            "additional_qualifying_amount": round(qualifying_payment - actual_payment, 2),
-            "loan_amount": round(loan_amount, 2),
-            "amortization_years": amortization,
-            "message": f"Must qualify at {qualifying_rate}% per OSFI B-20 stress test (higher of contract rate + 2% or 5.25%)"
-        }
-    except Exception as e:
-        return {"error": f"Stress test calculation failed: {str(e)}"}
+    if isinstance(event.get("contract_interest_rate"), list):
+        return _osfi_b20_stress_test_batch(event)
+
+    purchase_price, down_payment, contract_rate = _parse_floats(event, _STRESS_TEST_FIELDS)
+    amortization = int(event.get("amortization_years", 25))
+
+    if purchase_price == 0:
+        raise ValueError("Purchase price is required")
+    if amortization <= 0:
+        raise ValueError("Amortization period must be positive")
+
+    # Calculate loan amount
+    loan_amount = purchase_price - down_payment
+
+    # Determine qualifying rate
+    stress_rate_1 = contract_rate + 2.0
+    stress_rate_2 = 5.25
+    qualifying_rate = max(stress_rate_1, stress_rate_2)
+
+    # Calculate monthly payment at qualifying rate
+    monthly_rate = qualifying_rate / 100 / 12
+    num_payments = amortization * 12
+
+    qualifying_payment = _amort_payment(loan_amount, monthly_rate, num_payments)
+
+    # Calculate actual payment at contract rate
+    contract_monthly_rate = contract_rate / 100 / 12
+    actual_payment = _amort_payment(loan_amount, contract_monthly_rate, num_payments)
+
+    return {
+        "contract_rate": contract_rate,
+        "qualifying_rate": qualifying_rate,
+        "stress_test_applied": qualifying_rate > contract_rate,
+        "qualifying_payment": qualifying_payment,
+        "actual_payment": actual_payment,
+        "additional_qualifying_amount": qualifying_payment - actual_payment,
+        "loan_amount": loan_amount,
+        "amortization_years": amortization,
+        "message": f"Must qualify at {qualifying_rate}% per OSFI B-20 stress test (higher of contract rate + 2% or 5.25%)"
+    }
+
+
+def _osfi_b20_stress_test_batch(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Vectorized OSFI B-20 stress test over a batch of scenarios.
+
+    Any of purchase_price, down_payment, contract_interest_rate and
+    amortization_years may be a list; scalars are broadcast against them.
+    Results are returned as lists, one entry per scenario.
+
+    The gateway tool schema declares contract_interest_rate as a number, so
+    this path is only reachable by invoking the Lambda directly.
+    """
+    purchase_price = np.asarray(event.get("purchase_price", 0), dtype=np.float64)
+    down_payment = np.asarray(event.get("down_payment", 0), dtype=np.float64)
+    contract_rate = np.asarray(event.get("contract_interest_rate"), dtype=np.float64)
+    amortization = np.asarray(event.get("amortization_years", 25), dtype=np.int64)
+
+    if np.any(purchase_price == 0):
+        raise ValueError("Purchase price is required")
+    if not np.all(amortization > 0):
+        raise ValueError("Amortization period must be positive")
+
+    purchase_price, down_payment, contract_rate, amortization = np.broadcast_arrays(
+        purchase_price, down_payment, contract_rate, amortization
+    )
+
+    loan_amount = purchase_price - down_payment
+    qualifying_rate = np.maximum(contract_rate + 2.0, 5.25)
+    num_payments = amortization * 12
+
+    qualifying_payment = _amort_payment_array(loan_amount, qualifying_rate / 100 / 12, num_payments)
+    actual_payment = _amort_payment_array(loan_amount, contract_rate / 100 / 12, num_payments)
+
+    return {
+        "contract_rate": contract_rate.tolist(),
+        "qualifying_rate": qualifying_rate.tolist(),
+        "stress_test_applied": (qualifying_rate > contract_rate).tolist(),
+        "qualifying_payment": qualifying_payment.tolist(),
+        "actual_payment": actual_payment.tolist(),
+        "additional_qualifying_amount": (qualifying_payment - actual_payment).tolist(),
+        "loan_amount": loan_amount.tolist(),
+        "amortization_years": amortization.tolist(),
+        "message": "Each scenario must qualify at the higher of contract rate + 2% or 5.25% per OSFI B-20 stress test"
+    }
+
+
+# CMHC premium tiers: minimum down payment % -> premium % of the loan
+_CMHC_TIER_PCTS = (5.0, 10.0, 15.0, 20.0)
+_CMHC_TIER_RATES = (4.00, 3.10, 2.80, 0.0)
+
+# Array copies of the tiers for the batch code
+_CMHC_PCTS = np.array(_CMHC_TIER_PCTS)
+_CMHC_RATES = np.array(_CMHC_TIER_RATES)
+
+# Minimum down payment on the first $500K of a $500K-$1M purchase
+_MIN_DP_FIRST_500K = 500000 * 0.05
 
 
 def calculate_down_payment(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -204,64 +300,57 @@ def calculate_down_payment(event: Dict[str, Any]) -> Dict[str, Any]:
     - $500K-$1M: 5% on first $500K, 10% on remainder
     - >$1M: 20% minimum (no CMHC insurance available)
     """
-    try:
-        purchase_price = float(event.get("purchase_price", 0))
-        actual_down_payment = float(event.get("proposed_down_payment", 0))
+    purchase_price, actual_down_payment = _parse_floats(event, _DOWN_PAYMENT_FIELDS)
 
-        if purchase_price == 0:
-            return {"error": "Purchase price is required"}
+    if purchase_price == 0:
+        raise ValueError("Purchase price is required")
+
+    # Calculate minimum down payment
+    if purchase_price <= 500000:
+        min_down_payment = purchase_price * 0.05
+    elif purchase_price <= 1000000:
+        min_down_payment = _MIN_DP_FIRST_500K + ((purchase_price - 500000) * 0.10)
+    else:
+        min_down_payment = purchase_price * 0.20
+
+    # Calculate down payment percentage
+    down_payment_pct = (actual_down_payment / purchase_price) * 100
+
+    # Check if CMHC insurance required
+    cmhc_required = down_payment_pct < 20
+
+    # Calculate CMHC insurance premium (if applicable)
+    if cmhc_required and purchase_price < 1000000:
+        # CMHC premium rates based on down payment percentage
+        tier = bisect.bisect_right(_CMHC_TIER_PCTS, down_payment_pct) - 1
+        cmhc_rate = _CMHC_TIER_RATES[tier] if tier >= 0 else 0  # < 5% not eligible
+
+        cmhc_premium = (purchase_price - actual_down_payment) * (cmhc_rate / 100)
+    else:
+        cmhc_premium = 0
+        cmhc_rate = 0
+
+    # Check if down payment is sufficient
+    sufficient = actual_down_payment >= min_down_payment
+
+    return {
+        "purchase_price": purchase_price,
+        "min_down_payment": min_down_payment,
+        "actual_down_payment": actual_down_payment,
+        "down_payment_pct": down_payment_pct,
+        "sufficient": sufficient,
+        "cmhc_insurance_required": cmhc_required,
+        "cmhc_premium": cmhc_premium,
+        "cmhc_rate_pct": cmhc_rate,
+        "total_loan_amount": (purchase_price - actual_down_payment) + cmhc_premium,
+        "shortfall": max(0, min_down_payment - actual_down_payment),
+        "recommendation": "Approved - Down payment sufficient" if sufficient else f"Need ${min_down_payment - actual_down_payment:,.2f} more for minimum down payment"
+    }
 
-        # Calculate minimum down payment
-        if purchase_price <= 500000:
-            min_down_payment = purchase_price * 0.05
-        elif purchase_price <= 1000000:
-            min_down_payment = (500000 * 0.05) + ((purchase_price - 500000) * 0.10)
-        else:
-            min_down_payment = purchase_price * 0.20
-
-        # Calculate down payment percentage
-        down_payment_pct = (actual_down_payment / purchase_price) * 100
-
-        # Check if CMHC insurance required
-        cmhc_required = down_payment_pct < 20
-
-        # Calculate CMHC insurance premium (if applicable)
-        if cmhc_required and purchase_price < 1000000:
-            # CMHC premium rates based on down payment percentage
-            if down_payment_pct >= 20:
-                cmhc_rate = 0
-            elif down_payment_pct >= 15:
-                cmhc_rate = 2.80
-            elif down_payment_pct >= 10:
-                cmhc_rate = 3.10
-            elif down_payment_pct >= 5:
-                cmhc_rate = 4.00
-            else:
-                cmhc_rate = 0  # Not eligible
-
-            cmhc_premium = (purchase_price - actual_down_payment) * (cmhc_rate / 100)
-        else:
-            cmhc_premium = 0
-            cmhc_rate = 0
-
-        # Check if down payment is sufficient
-        sufficient = actual_down_payment >= min_down_payment
-
-        return {
-            "purchase_price": round(purchase_price, 2),
-            "min_down_payment": round(min_down_payment, 2),
-            "actual_down_payment": round(actual_down_payment, 2),
-            "down_payment_pct": round(down_payment_pct, 2),
-            "sufficient": sufficient,
-            "cmhc_insurance_required": cmhc_required,
-            "cmhc_premium": round(cmhc_premium, 2),
-            "cmhc_rate_pct": cmhc_rate,
-            "total_loan_amount": round((purchase_price - actual_down_payment) + cmhc_premium, 2),
-            "shortfall": round(max(0, min_down_payment - actual_down_payment), 2),
-            "recommendation": "Approved - Down payment sufficient" if sufficient else f"Need ${round(min_down_payment - actual_down_payment, 2):,.2f} more for minimum down payment"
-        }
-    except Exception as e:
-        return {"error": f"Down payment calculation failed: {str(e)}"}
+
+# Credit score category boundaries; a score at a boundary falls in the higher category
+_CREDIT_THRESHOLDS = (600, 650, 720, 800)
+_CREDIT_LABELS = ("Poor", "Fair", "Good", "Very Good", "Excellent")
 
 
 def check_credit_threshold(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -271,43 +360,244 @@ def check_credit_threshold(event: Dict[str, Any]) -> Dict[str, Any]:
     CMHC insured mortgages (< 20% down): 600+ credit score
     Conventional mortgages (≥ 20% down): 650+ credit score
     """
-    try:
-        credit_score = int(event.get("credit_score", 0))
-        down_payment_pct = float(event.get("down_payment_percentage", 5))
+    credit_score = int(event.get("credit_score", 0))
+    (down_payment_pct,) = _parse_floats(event, _CREDIT_FIELDS)
 
-        if credit_score == 0:
-            return {"error": "Credit score is required"}
+    if credit_score == 0:
+        raise ValueError("Credit score is required")
 
-        # Determine minimum score based on mortgage type
-        if down_payment_pct >= 20:
-            min_score = 650  # Conventional mortgage
-            mortgage_type = "Conventional"
-        else:
-            min_score = 600  # CMHC insured
-            mortgage_type = "CMHC Insured"
-
-        approved = credit_score >= min_score
-
-        # Credit score categories
-        if credit_score >= 800:
-            category = "Excellent"
-        elif credit_score >= 720:
-            category = "Very Good"
-        elif credit_score >= 650:
-            category = "Good"
-        elif credit_score >= 600:
-            category = "Fair"
+    # Determine minimum score based on mortgage type
+    if down_payment_pct >= 20:
+        min_score = 650  # Conventional mortgage
+        mortgage_type = "Conventional"
+    else:
+        min_score = 600  # CMHC insured
+        mortgage_type = "CMHC Insured"
+
+    approved = credit_score >= min_score
+
+    # Credit score categories
+    category = _CREDIT_LABELS[bisect.bisect_right(_CREDIT_THRESHOLDS, credit_score)]
+
+    return {
+        "credit_score": credit_score,
+        "category": category,
+        "min_required_score": min_score,
+        "mortgage_type": mortgage_type,
+        "approved": approved,
+        "points_above_minimum": credit_score - min_score,
+        "recommendation": "Approved - Credit score meets requirements" if approved else f"Denied - Credit score too low (need {min_score}+ for {mortgage_type} mortgage)"
+    }
+
+
+################################################################################
+# Batch Pre-Qualification
+################################################################################
+
+# Batch arguments as (key, default) pairs, in _batch_qualify_numpy argument order
+_BATCH_FIELDS = (
+    ("purchase_price", 0.0),
+    ("down_payment", 0.0),
+    ("contract_interest_rate", 3.5),
+    ("amortization_years", 25.0),
+    ("gross_annual_income", 0.0),
+    ("monthly_property_taxes", 0.0),
+    ("monthly_heating", 0.0),
+    ("monthly_condo_fees", 0.0),
+    ("monthly_other_debts", 0.0),
+    ("credit_score", 0.0),
+)
+
+# Per-scenario result columns, in the order the batch kernels produce them
+_BATCH_RESULT_FIELDS = (
+    "loan_amount",
+    "qualifying_rate",
+    "qualifying_payment",
+    "gds_ratio",
+    "tds_ratio",
+    "min_down_payment",
+    "down_payment_pct",
+    "cmhc_rate_pct",
+    "cmhc_premium",
+    "min_required_score",
+    "gds_pass",
+    "tds_pass",
+    "down_payment_sufficient",
+    "credit_approved",
+    "qualified",
+)
+
+
+def _batch_qualify_numpy(purchase_price, down_payment, contract_rate, amortization,
+                         gross_income, property_taxes, heating, condo_fees, other_debts, credit_score):
+    """
+    Run the full pre-qualification pipeline over equal-length float64 arrays.
+
+    GDS/TDS are computed with the OSFI B-20 qualifying payment. Returns a
+    record array with one record per scenario (fields: _BATCH_RESULT_FIELDS).
+    Reference implementation for _batch_qualify_kernel.
+    """
+    # OSFI B-20 stress test
+    loan_amount = purchase_price - down_payment
+    qualifying_rate = np.maximum(contract_rate + 2.0, 5.25)
+    qualifying_payment = _amort_payment_array(loan_amount, qualifying_rate / 100 / 12, amortization * 12)
+
+    # GDS/TDS at the qualifying payment
+    monthly_income = gross_income / 12
+    gds_costs = qualifying_payment + property_taxes + heating + (0.5 * condo_fees)
+    gds_ratio = (gds_costs / monthly_income) * 100
+    tds_ratio = ((gds_costs + other_debts) / monthly_income) * 100
+
+    # Down payment and CMHC insurance
+    min_down_payment = np.select(
+        [purchase_price <= 500000, purchase_price <= 1000000],
+        [purchase_price * 0.05, _MIN_DP_FIRST_500K + (purchase_price - 500000) * 0.10],
+        purchase_price * 0.20,
+    )
+    down_payment_pct = (down_payment / purchase_price) * 100
+    tier = np.searchsorted(_CMHC_PCTS, down_payment_pct, side="right") - 1
+    cmhc_rate = np.where((tier >= 0) & (purchase_price < 1000000), _CMHC_RATES[np.maximum(tier, 0)], 0.0)
+    cmhc_premium = loan_amount * (cmhc_rate / 100)
+
+    # Credit threshold: conventional (>= 20% down) vs CMHC insured
+    min_score = np.where(down_payment_pct >= 20, 650, 600)
+
+    gds_pass = gds_ratio <= 39
+    tds_pass = tds_ratio <= 44
+    sufficient = down_payment >= min_down_payment
+    credit_approved = credit_score >= min_score
+
+    return np.rec.fromarrays(
+        [
+            loan_amount, qualifying_rate, qualifying_payment, gds_ratio, tds_ratio,
+            min_down_payment, down_payment_pct, cmhc_rate, cmhc_premium, min_score,
+            gds_pass, tds_pass, sufficient, credit_approved,
+            gds_pass & tds_pass & sufficient & credit_approved,
+        ],
+        names=_BATCH_RESULT_FIELDS,
+    )
+
+
+@njit(parallel=True)
+def _batch_qualify_kernel(purchase_price, down_payment, contract_rate, amortization,
+                          gross_income, property_taxes, heating, condo_fees, other_debts, credit_score):
+    """
+    Loop-style equivalent of _batch_qualify_numpy, parallelized over scenarios.
+
+    Each scenario is computed in scalars so no temporary arrays are allocated.
+    Compiled without fastmath so tier and threshold comparisons round exactly
+    like the NumPy reference. Returns one array per field of _BATCH_RESULT_FIELDS.
+    """
+    n = purchase_price.shape[0]
+    loan_amount = np.empty(n)
+    qualifying_rate = np.empty(n)
+    qualifying_payment = np.empty(n)
+    gds_ratio = np.empty(n)
+    tds_ratio = np.empty(n)
+    min_down_payment = np.empty(n)
+    down_payment_pct = np.empty(n)
+    cmhc_rate = np.empty(n)
+    cmhc_premium = np.empty(n)
+    min_score = np.empty(n, dtype=np.int64)
+    gds_pass = np.empty(n, dtype=np.bool_)
+    tds_pass = np.empty(n, dtype=np.bool_)
+    sufficient = np.empty(n, dtype=np.bool_)
+    credit_approved = np.empty(n, dtype=np.bool_)
+    qualified = np.empty(n, dtype=np.bool_)
+
+    for i in prange(n):
+        price = purchase_price[i]
+
+        # OSFI B-20 stress test
+        loan = price - down_payment[i]
+        rate = max(contract_rate[i] + 2.0, 5.25)
+        payment = _amort_payment_jit(loan, rate / 100.0 / 12.0, amortization[i] * 12.0)
+
+        # GDS/TDS at the qualifying payment
+        monthly_income = gross_income[i] / 12.0
+        gds_costs = payment + property_taxes[i] + heating[i] + (0.5 * condo_fees[i])
+        gds = (gds_costs / monthly_income) * 100.0
+        tds = ((gds_costs + other_debts[i]) / monthly_income) * 100.0
+
+        # Down payment and CMHC insurance
+        if price <= 500000.0:
+            min_down = price * 0.05
+        elif price <= 1000000.0:
+            min_down = _MIN_DP_FIRST_500K + (price - 500000.0) * 0.10
         else:
-            category = "Poor"
-
-        return {
-            "credit_score": credit_score,
-            "category": category,
-            "min_required_score": min_score,
-            "mortgage_type": mortgage_type,
-            "approved": approved,
-            "points_above_minimum": credit_score - min_score,
-            "recommendation": "Approved - Credit score meets requirements" if approved else f"Denied - Credit score too low (need {min_score}+ for {mortgage_type} mortgage)"
-        }
-    except Exception as e:
-        return {"error": f"Credit check failed: {str(e)}"}
\ No newline at end of file
+            min_down = price * 0.20
+        pct = (down_payment[i] / price) * 100.0
+        premium_rate = 0.0
+        if price < 1000000.0:
+            for t in range(_CMHC_PCTS.shape[0]):
+                if pct >= _CMHC_PCTS[t]:
+                    premium_rate = _CMHC_RATES[t]
+
+        # Credit threshold: conventional (>= 20% down) vs CMHC insured
+        score = 650 if pct >= 20.0 else 600
+
+        loan_amount[i] = loan
+        qualifying_rate[i] = rate
+        qualifying_payment[i] = payment
+        gds_ratio[i] = gds
+        tds_ratio[i] = tds
+        min_down_payment[i] = min_down
+        down_payment_pct[i] = pct
+        cmhc_rate[i] = premium_rate
+        cmhc_premium[i] = loan * (premium_rate / 100.0)
+        min_score[i] = score
+        gds_pass[i] = gds <= 39.0
+        tds_pass[i] = tds <= 44.0
+        sufficient[i] = down_payment[i] >= min_down
+        credit_approved[i] = credit_score[i] >= score
+        qualified[i] = gds_pass[i] and tds_pass[i] and sufficient[i] and credit_approved[i]
+
+    return (
+        loan_amount, qualifying_rate, qualifying_payment, gds_ratio, tds_ratio,
+        min_down_payment, down_payment_pct, cmhc_rate, cmhc_premium, min_score,
+        gds_pass, tds_pass, sufficient, credit_approved, qualified,
+    )
+
+
+def batch_qualify(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pre-qualify a batch of mortgage scenarios in one call.
+
+    Accepts the stress test, GDS/TDS and credit arguments, each either a list
+    (one entry per scenario) or a scalar applied to every scenario. Returns
+    one list per result field.
+    """
+    args = np.broadcast_arrays(
+        *(np.asarray(event.get(key, default), dtype=np.float64) for key, default in _BATCH_FIELDS)
+    )
+    # Copy the read-only broadcast views into owned, contiguous arrays for the kernel
+    args = [np.array(np.atleast_1d(a), dtype=np.float64, copy=True) for a in args]
+    purchase_price, amortization, gross_income, credit_score = args[0], args[3], args[4], args[9]
+
+    if purchase_price.ndim != 1:
+        raise ValueError("Scenario arguments must be numbers or flat lists of numbers")
+    if not all(np.isfinite(a).all() for a in args):
+        raise ValueError("Scenario arguments must be finite numbers")
+    if np.any(purchase_price == 0):
+        raise ValueError("Purchase price is required")
+    if not np.all(amortization > 0):
+        raise ValueError("Amortization period must be positive")
+    if np.any(gross_income == 0):
+        raise ValueError("Gross annual income is required")
+    if np.any(credit_score == 0):
+        raise ValueError("Credit score is required")
+
+    results = _batch_qualify_kernel(*args)
+    return {name: column.tolist() for name, column in zip(_BATCH_RESULT_FIELDS, results)}
+
+
+# Tool name -> handler, looked up by lambda_handler
+_TOOLS = {
+    # Canadian Mortgage Pre-Qualification Tools
+    "calculate_gds_tds": calculate_gds_tds,
+    "osfi_b20_stress_test": osfi_b20_stress_test,
+    "calculate_down_payment": calculate_down_payment,
+    "check_credit_threshold": check_credit_threshold,
+    "batch_qualify": batch_qualify,
+    "placeholder_tool": placeholder_tool,
+}
@@ -1,6 +1,5 @@
 import os
 from strands import Agent, tool
-from strands_tools.code_interpreter import AgentCoreCodeInterpreter
 from bedrock_agentcore import BedrockAgentCoreApp
 from bedrock_agentcore.memory.integrations.strands.config import AgentCoreMemoryConfig, RetrievalConfig
 from bedrock_agentcore.memory.integrations.strands.session_manager import AgentCoreMemorySessionManager
@@ -9,6 +8,13 @@ from .model.load import load_model
 
 MEMORY_ID = os.getenv("BEDROCK_AGENTCORE_MEMORY_ID")
 REGION = os.getenv("AWS_REGION")
+_HAS_MEMORY = bool(MEMORY_ID)
+
+# ============================================================================
+# DEMO MODE: Set DEMO_MODE=1 in environment to disable streaming
+# This makes it easier to capture full responses for screenshots/demos
+# ============================================================================
+DEMO_MODE = os.getenv("DEMO_MODE", "0") == "1"
 
 if os.getenv("LOCAL_DEV") == "1":
     # In local dev, instantiate dummy MCP client so the code runs without deploying
@@ -31,53 +37,7 @@ def add_numbers(a: int, b: int) -> int:
 app = BedrockAgentCoreApp()
 log = app.logger
 
-@app.entrypoint
-async def invoke(payload, context):
-    # Extract session_id from context (auto-managed by BedrockAgentCore)
-    session_id = getattr(context, 'session_id', 'default')
-
-    # Extract user_id from payload, or use default
-    user_id = payload.get('user_id', 'default-user')
-
-    log.info(f"Processing request for user: {user_id}, session: {session_id}")
-
-    # Configure memory if available
-    session_manager = None
-    if MEMORY_ID:
-        session_manager = AgentCoreMemorySessionManager(
-            AgentCoreMemoryConfig(
-                memory_id=MEMORY_ID,
-                session_id=session_id,
-                actor_id=user_id,  # Dynamic user ID
-                retrieval_config={
-                    f"/users/{user_id}/facts": RetrievalConfig(top_k=3, relevance_score=0.5),
-                    f"/users/{user_id}/preferences": RetrievalConfig(top_k=3, relevance_score=0.5)
-                }
-            ),
-            REGION
-        )
-        log.info(f"Memory enabled for user: {user_id}, session: {session_id}")
-    else:
-        log.warning("MEMORY_ID is not set. Skipping memory session manager initialization.")
-
-
-    # Create code interpreter
-    code_interpreter = AgentCoreCodeInterpreter(
-        region=REGION,
-        session_name=session_id,
-        auto_create=True,
-        persist_sessions=True
-    )
-
-    with strands_mcp_client as client:
-        # Get MCP Tools
-        tools = client.list_tools_sync()
-
-        # Create agent
-        agent = Agent(
-            model=load_model(),
-            session_manager=session_manager,
-            system_prompt="""
+SYSTEM_PROMPT = """
                 You are a Canadian mortgage pre-qualification specialist with expertise in CMHC guidelines and OSFI regulations.
 
                 **IMPORTANT - Memory & Session Continuity:**
@@ -113,6 +73,7 @@ async def invoke(payload, context):
                 - osfi_b20_stress_test: Apply OSFI B-20 stress test
                 - calculate_down_payment: Check down payment and CMHC insurance
                 - check_credit_threshold: Verify credit score eligibility
+                - batch_qualify: Compare many scenarios at once (e.g., several rates, down payments or amortizations)
                 - code_interpreter: For complex calculations
                 - add_numbers: For simple arithmetic
 
@@ -126,46 +87,129 @@ async def invoke(payload, context):
 
                 Always be professional, accurate, and cite specific Canadian regulations.
                 Show your calculations and reasoning clearly.
-            """,
-            tools=[code_interpreter.code_interpreter, add_numbers] + tools
+            """
+
+_mcp_client = None
+_mcp_tools = None
+_model = None
+
+
+def _get_model():
+    """Load the Bedrock model once; it holds no per-session state."""
+    global _model
+    if _model is None:
+        _model = load_model()
+    return _model
+
+
+def _get_mcp_tools():
+    """
+    Start the MCP client on first use and cache its tools.
+    The client session stays open for the lifetime of the container, so a
+    failed tool listing is retried on the already-started client.
+    """
+    global _mcp_client, _mcp_tools
+    if _mcp_tools is None:
+        if _mcp_client is None:
+            _mcp_client = strands_mcp_client.__enter__()
+        _mcp_tools = _mcp_client.list_tools_sync()
+    return _mcp_tools
+
+
+def _code_interpreter(session_id):
+    """
+    Create the code interpreter for a session.
+    Imported here so strands_tools is only loaded once an agent is built.
+    """
+    from strands_tools.code_interpreter import AgentCoreCodeInterpreter
+
+    return AgentCoreCodeInterpreter(
+        region=REGION,
+        session_name=session_id,
+        auto_create=True,
+        persist_sessions=True
+    )
+
+
+def _create_agent(session_id, user_id):
+    """
+    Build a fresh agent for one invocation.
+    Only the session-independent parts (model, MCP tools) are reused.
+    """
+    # Configure memory if available
+    session_manager = None
+    if _HAS_MEMORY:
+        session_manager = AgentCoreMemorySessionManager(
+            AgentCoreMemoryConfig(
+                memory_id=MEMORY_ID,
+                session_id=session_id,
+                actor_id=user_id,  # Dynamic user ID
+                retrieval_config={
+                    f"/users/{user_id}/facts": RetrievalConfig(top_k=3, relevance_score=0.5),
+                    f"/users/{user_id}/preferences": RetrievalConfig(top_k=3, relevance_score=0.5)
+                }
+            ),
+            REGION
         )
+        log.info("Memory enabled for user: %s, session: %s", user_id, session_id)
+    else:
+        log.warning("MEMORY_ID is not set. Skipping memory session manager initialization.")
+
+    # Create code interpreter
+    code_interpreter = _code_interpreter(session_id)
+
+    # Create agent
+    return Agent(
+        model=_get_model(),
+        session_manager=session_manager,
+        system_prompt=SYSTEM_PROMPT,
+        tools=[code_interpreter.code_interpreter, add_numbers] + _get_mcp_tools()
+    )
+
+
+@app.entrypoint
+async def invoke(payload, context):
+    # Extract session_id from context (auto-managed by BedrockAgentCore)
+    session_id = getattr(context, 'session_id', 'default')
+
+    # Extract user_id from payload, or use default
+    user_id = payload.get('user_id', 'default-user')
 
-        # ========================================================================
-        # DEMO MODE: Set DEMO_MODE=1 in environment to disable streaming
-        # This makes it easier to capture full responses for screenshots/demos
-        # ========================================================================
-        DEMO_MODE = os.getenv("DEMO_MODE", "0") == "1"
-
-        if DEMO_MODE:
-            # NON-STREAMING MODE (Better for demos/screenshots)
-            # Returns complete response in one message
-            log.info("Running in DEMO MODE (non-streaming)")
-            response = agent(payload.get("prompt"))
-
-            # Extract the full text response
-            if hasattr(response, 'message') and 'content' in response.message:
-                # Yield the complete response as a single chunk
-                yield response.message['content'][0]['text']
-            else:
-                yield str(response)
+    log.info("Processing request for user: %s, session: %s", user_id, session_id)
 
+    agent = _create_agent(session_id, user_id)
+
+    if DEMO_MODE:
+        # NON-STREAMING MODE (Better for demos/screenshots)
+        # Returns complete response in one message
+        log.info("Running in DEMO MODE (non-streaming)")
+        response = agent(payload.get("prompt"))
+
+        # Extract the full text response
+        if hasattr(response, 'message') and 'content' in response.message:
+            # Yield the complete response as a single chunk
+            yield response.message['content'][0]['text']
         else:
-            # STREAMING MODE (Production - shows real-time progress)
-            log.info("Running in STREAMING MODE")
-            stream = agent.stream_async(payload.get("prompt"))
-
-            async for event in stream:
-                # Handle Text parts of the response
-                if "data" in event and isinstance(event["data"], str):
-                    yield event["data"]
-
-                # Implement additional handling for other events
-                # if "toolUse" in event:
-                #   # Process toolUse
-
-                # Handle end of stream
-                # if "result" in event:
-                #    yield(format_response(event["result"]))
+            yield str(response)
+
+    else:
+        # STREAMING MODE (Production - shows real-time progress)
+        log.info("Running in STREAMING MODE")
+        stream = agent.stream_async(payload.get("prompt"))
+
+        async for event in stream:
+            # Handle Text parts of the response
+            data = event.get("data")
+            if type(data) is str:
+                yield data
+
+            # Implement additional handling for other events
+            # if "toolUse" in event:
+            #   # Process toolUse
+
+            # Handle end of stream
+            # if "result" in event:
+            #    yield(format_response(event["result"]))
 
 def format_response(result) -> str:
     """Extract code from metrics and format with LLM response."""
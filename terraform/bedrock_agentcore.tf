@@ -206,7 +206,8 @@ resource "null_resource" "lambda_dependencies" {
       rm -rf ../${path.root}/.lambda_build
       mkdir -p ../${path.root}/.lambda_build
       cp ../${path.root}/mcp/lambda/lambda_function.py ../${path.root}/.lambda_build/
-      pip install -r ../${path.root}/mcp/lambda/requirements.txt -t ../${path.root}/.lambda_build/ --upgrade
+      pip install -r ../${path.root}/mcp/lambda/requirements.txt -t ../${path.root}/.lambda_build/ --upgrade \
+        --platform manylinux2014_x86_64 --only-binary=:all: --python-version 3.12
     EOF
   }
 }
@@ -225,6 +226,11 @@ resource "aws_lambda_function" "mcp_lambda" {
   handler       = "lambda_function.lambda_handler"
   runtime       = "python3.12"
 
+  # numpy/numba need headroom over the 128 MB default, and the JIT compiles
+  # each kernel on its first call in a new container
+  memory_size = 512
+  timeout     = 30
+
   filename         = data.archive_file.mcp_lambda_zip.output_path
   source_code_hash = data.archive_file.mcp_lambda_zip.output_base64sha256
 }
@@ -537,6 +543,127 @@ resource "aws_bedrockagentcore_gateway_target" "check_credit_threshold_target" {
   }
 }
 
+################################################################################
+# Gateway Target 5: Batch Pre-Qualification
+################################################################################
+resource "aws_bedrockagentcore_gateway_target" "batch_qualify_target" {
+  name               = "${var.app_name}-Batch-Qualify-Target"
+  gateway_identifier = aws_bedrockagentcore_gateway.agentcore_gateway.gateway_id
+
+  credential_provider_configuration {
+    gateway_iam_role {}
+  }
+
+  target_configuration {
+    mcp {
+      lambda {
+        lambda_arn = aws_lambda_function.mcp_lambda.arn
+
+        tool_schema {
+          inline_payload {
+            name        = "batch_qualify"
+            description = "Pre-qualify many mortgage scenarios at once (e.g., comparing rates, down payments or amortizations). Runs the OSFI B-20 stress test, GDS/TDS at the qualifying payment, down payment/CMHC and credit checks for each scenario. All lists must have the same length; returns one list per result field."
+            input_schema {
+              type        = "object"
+              description = "Scenario inputs, one list entry per scenario"
+              property {
+                name        = "purchase_price"
+                type        = "array"
+                description = "Property purchase prices in CAD, one per scenario"
+                required    = true
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "down_payment"
+                type        = "array"
+                description = "Down payment amounts in CAD, one per scenario"
+                required    = true
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "contract_interest_rate"
+                type        = "array"
+                description = "Contract interest rates as percentages (e.g., 3.5 for 3.5%), one per scenario"
+                required    = true
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "amortization_years"
+                type        = "array"
+                description = "Amortization periods in years, one per scenario (default 25)"
+                required    = false
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "gross_annual_income"
+                type        = "array"
+                description = "Applicant gross annual incomes in CAD, one per scenario"
+                required    = true
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "monthly_property_taxes"
+                type        = "array"
+                description = "Monthly property taxes, one per scenario"
+                required    = false
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "monthly_heating"
+                type        = "array"
+                description = "Monthly heating costs, one per scenario"
+                required    = false
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "monthly_condo_fees"
+                type        = "array"
+                description = "Monthly condo fees, one per scenario"
+                required    = false
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "monthly_other_debts"
+                type        = "array"
+                description = "Monthly other debt payments, one per scenario"
+                required    = false
+                items {
+                  type = "number"
+                }
+              }
+              property {
+                name        = "credit_score"
+                type        = "array"
+                description = "Applicant credit scores (300-900 range), one per scenario"
+                required    = true
+                items {
+                  type = "number"
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+
 ################################################################################
 # AgentCore Runtime IAM Roles
 ################################################################################
@@ -7,7 +7,6 @@ This script shows how to invoke an agent and maintain conversation context acros
 import boto3
 import json
 import uuid
-import time
 
 # Configuration - Update these with your values
 REGION = "YOUR AWS_REGION"
@@ -62,25 +61,19 @@ def send_prompt(prompt_number, prompt_text):
             print("AGENT RESPONSE:")
             print("-" * 80)
 
-            # Read the response stream
+            # Read the response stream, collecting raw bytes and decoding once
             try:
+                chunks = []
                 for event in response_stream:
                     # Handle different event types
                     if isinstance(event, dict):
-                        if 'chunk' in event:
-                            chunk = event['chunk']
-                            if 'bytes' in chunk:
-                                text = chunk['bytes'].decode('utf-8')
-                                full_response += text
-                                print(text, end='', flush=True)
-                        elif 'bytes' in event:
-                            text = event['bytes'].decode('utf-8')
-                            full_response += text
-                            print(text, end='', flush=True)
+                        chunk = event.get('chunk', event)
+                        if 'bytes' in chunk:
+                            chunks.append(chunk['bytes'])
                     elif isinstance(event, bytes):
-                        text = event.decode('utf-8')
-                        full_response += text
-                        print(text, end='', flush=True)
+                        chunks.append(event)
+                full_response = b"".join(chunks).decode('utf-8')
+                print(full_response, end='')
             except Exception as stream_error:
                 print(f"\nStream parsing error: {stream_error}")
                 try:
@@ -115,27 +108,18 @@ send_prompt(
     "Hi, my name is John. I make $85,000 per year and my credit score is 680."
 )
 
-print("\nWaiting 2 seconds...\n")
-time.sleep(2)
-
 # Prompt 2: Test memory recall - credit score
 send_prompt(
     2,
     "What is my credit score?"
 )
 
-print("\nWaiting 2 seconds...\n")
-time.sleep(2)
-
 # Prompt 3: Test memory recall - income
 send_prompt(
     3,
     "What is my annual income?"
 )
 
-print("\nWaiting 2 seconds...\n")
-time.sleep(2)
-
 # Prompt 4: Test memory recall - name
 send_prompt(
     4,
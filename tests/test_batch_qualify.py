@@ -0,0 +1,121 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The Lambda's dependencies come from the "test" extra, not the base install
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+pytest.importorskip("orjson")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "mcp" / "lambda"))
+
+import lambda_function as lf  # noqa: E402
+
+
+def _scenarios(purchase_price, down_payment, **overrides):
+    """Build _BATCH_FIELDS-ordered float64 arrays for the given scenarios."""
+    purchase_price = np.asarray(purchase_price, dtype=np.float64)
+    values = {"purchase_price": purchase_price, "down_payment": down_payment}
+    values.setdefault("gross_annual_income", 150000.0)
+    values.setdefault("credit_score", 625.0)
+    values.update(overrides)
+    return [
+        np.ascontiguousarray(np.broadcast_to(np.asarray(values.get(key, default), dtype=np.float64), purchase_price.shape))
+        for key, default in lf._BATCH_FIELDS
+    ]
+
+
+def _assert_kernel_matches_reference(args):
+    expected = lf._batch_qualify_numpy(*args)
+    actual = lf._batch_qualify_kernel(*args)
+    for name, column in zip(lf._BATCH_RESULT_FIELDS, actual):
+        if column.dtype.kind == "f":
+            np.testing.assert_allclose(column, expected[name], rtol=1e-9, err_msg=name)
+        else:
+            np.testing.assert_array_equal(column, expected[name], err_msg=name)
+
+
+# (purchase_price, down_payment) at exact down payment tier and price boundaries
+BOUNDARY_SCENARIOS = [
+    (500000.0, 25000.0),     # 5% down, minimum on a $500K purchase
+    (500000.0, 50000.0),     # 10% down
+    (500000.0, 75000.0),     # 15% down
+    (500000.0, 100000.0),    # 20% down, conventional
+    (700000.0, 140000.0),    # 20% down
+    (999999.0, 199999.8),    # 20% down just under $1M
+    (1000000.0, 75000.0),    # $1M minimum down payment, no CMHC insurance
+    (1000000.0, 100000.0),   # 10% down at $1M
+    (1000000.0, 200000.0),   # 20% down at $1M
+    (1000001.0, 200000.2),   # 20% down just over $1M
+]
+
+
+def test_kernel_matches_reference_at_boundaries():
+    price, down = map(list, zip(*BOUNDARY_SCENARIOS))
+    _assert_kernel_matches_reference(_scenarios(price, down))
+
+
+@pytest.mark.parametrize("purchase_price,down_payment", BOUNDARY_SCENARIOS)
+def test_kernel_matches_single_scenario_tools_at_boundaries(purchase_price, down_payment):
+    results = dict(zip(
+        lf._BATCH_RESULT_FIELDS,
+        lf._batch_qualify_kernel(*_scenarios([purchase_price], down_payment)),
+    ))
+    down = lf.calculate_down_payment({"purchase_price": purchase_price, "proposed_down_payment": down_payment})
+    credit = lf.check_credit_threshold({"credit_score": 625, "down_payment_percentage": down["down_payment_pct"]})
+
+    assert results["cmhc_rate_pct"][0] == down["cmhc_rate_pct"]
+    assert results["min_down_payment"][0] == pytest.approx(down["min_down_payment"])
+    assert results["down_payment_sufficient"][0] == down["sufficient"]
+    assert results["min_required_score"][0] == credit["min_required_score"]
+    assert results["credit_approved"][0] == credit["approved"]
+
+
+def test_kernel_matches_reference_on_random_scenarios():
+    rng = np.random.default_rng(0)
+    n = 50000
+    price = rng.uniform(2e5, 2e6, n)
+    # Snap a share of down payments onto exact tier percentages
+    pct = np.where(rng.random(n) < 0.5, rng.choice([5.0, 10.0, 15.0, 20.0], n), rng.uniform(0, 30, n))
+    args = _scenarios(
+        price,
+        price * pct / 100,
+        contract_interest_rate=rng.uniform(0, 8, n),
+        amortization_years=rng.integers(10, 31, n).astype(np.float64),
+        gross_annual_income=rng.uniform(5e4, 3e5, n),
+        monthly_property_taxes=rng.uniform(0, 800, n),
+        monthly_heating=rng.uniform(0, 300, n),
+        monthly_condo_fees=rng.uniform(0, 700, n),
+        monthly_other_debts=rng.uniform(0, 2000, n),
+        credit_score=rng.integers(500, 900, n).astype(np.float64),
+    )
+    _assert_kernel_matches_reference(args)
+
+
+def test_batch_qualify_rejects_non_positive_amortization():
+    with pytest.raises(ValueError, match="Amortization period must be positive"):
+        lf.batch_qualify({
+            "purchase_price": [500000, 600000],
+            "down_payment": 50000,
+            "amortization_years": [25, 0],
+            "gross_annual_income": 100000,
+            "credit_score": 700,
+        })
+
+
+@pytest.mark.parametrize("overrides,message", [
+    ({"amortization_years": "nan"}, "finite"),
+    ({"gross_annual_income": [100000, float("inf")]}, "finite"),
+    ({"purchase_price": [[500000, 600000]]}, "flat lists"),
+])
+def test_batch_qualify_rejects_invalid_scenarios(overrides, message):
+    event = {
+        "purchase_price": [500000, 600000],
+        "down_payment": 50000,
+        "gross_annual_income": 100000,
+        "credit_score": 700,
+    }
+    event.update(overrides)
+    with pytest.raises(ValueError, match=message):
+        lf.batch_qualify(event)